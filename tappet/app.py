@@ -1,4 +1,5 @@
 import json
+import math
 from pathlib import Path
 from typing import Optional, Union
 
@@ -11,10 +12,21 @@ from textual.widgets import Button, Footer, Header, Label, ListItem, ListView, S
 
 from tappet.http_client import execute_request
 from tappet.models import RequestSet, Response
+from tappet.storage.requests import resolve_request_body
 from tappet.store import RequestSetStore
 from tappet.utils.clipboard import copy_to_clipboard
 from tappet.utils.editor import open_in_editor
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+RUNNING_RESPONSE = Response(note="Running...")
+RESPONSE_CACHE_SIZE = 32
+BODY_DISPLAY_LIMIT = 4000
+PRETTY_PRINT_MAX = 256 * 1024
+
 
 class RequestListWidget(ListView):
     can_focus = True
@@ -37,21 +49,40 @@ class RequestListWidget(ListView):
         super().__init__(*args, **kwargs)
         self.store = store
         self.request_sets: list[RequestSet] = []
+        self._labels: list[Label] = []
+        self._label_names: list[str] = []
+        self._index_by_id: dict[int, int] = {}
         self.store.subscribe_items(self._on_items_change)
         self.store.subscribe_selection(self._on_selection_change)
 
     def _on_items_change(self, select_set: Optional[RequestSet]) -> None:
-        self.clear()
-        self.request_sets = self.store.items
+        self.request_sets = list(self.store.items)
+        self._index_by_id = {id(request_set): index for index, request_set in enumerate(self.request_sets)}
+        names = [request_set.name for request_set in self.request_sets]
+        with self.app.batch_update():
+            if not names or not self._labels:
+                self.clear()
+                self._labels = []
+                if not names:
+                    self.append(ListItem(Label("no requests found")))
+            for label, old_name, name in zip(self._labels, self._label_names, names):
+                if name != old_name:
+                    label.update(name)
+            if len(self._labels) > len(names):
+                for item in list(self.children)[len(names):]:
+                    item.remove()
+                del self._labels[len(names):]
+            elif len(names) > len(self._labels):
+                new_labels = [Label(name) for name in names[len(self._labels):]]
+                self.extend([ListItem(label) for label in new_labels])
+                self._labels.extend(new_labels)
+        self._label_names = names
         if not self.request_sets:
-            self.append(ListItem(Label("no requests found")))
             return
 
         selected_index: Optional[int] = None
-        for index, request_set in enumerate(self.request_sets):
-            self.append(ListItem(Label(request_set.name)))
-            if select_set is not None and request_set == select_set:
-                selected_index = index
+        if select_set is not None:
+            selected_index = self._index_by_id.get(id(select_set))
 
         if selected_index is None:
             selected_index = 0
@@ -60,10 +91,9 @@ class RequestListWidget(ListView):
     def _on_selection_change(self, select_set: Optional[RequestSet]) -> None:
         if not self.request_sets or select_set is None:
             return
-        for index, request_set in enumerate(self.request_sets):
-            if request_set == select_set:
-                self.index = index
-                break
+        index = self._index_by_id.get(id(select_set))
+        if index is not None:
+            self.index = index
 
     def get_selected_request_set(self) -> Optional[RequestSet]:
         return self.store.get_selected()
@@ -96,8 +126,11 @@ class RequestListWidget(ListView):
             return
         if request_set.file_path is None:
             return
+        modified_before = self._get_mtime_ns(request_set.file_path)
         self._open_editor(request_set.file_path)
-        self.store.refresh(select_set=request_set)
+        if modified_before is not None and self._get_mtime_ns(request_set.file_path) == modified_before:
+            return
+        self.store.reload(request_set)
 
     def action_run_request(self) -> None:
         request_set = self.store.get_selected()
@@ -108,6 +141,12 @@ class RequestListWidget(ListView):
     def on_list_view_selected(self, event: ListView.Selected) -> None:
         self.action_run_request()
 
+    def _get_mtime_ns(self, path: Path) -> Optional[int]:
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return None
+
     def _open_editor(self, path: Path) -> None:
         app = self.app
         if app is None or app._driver is None:
@@ -130,6 +169,10 @@ class DetailPanelWidget(Container):
         ("right", "next_tab", "Next Tab"),
     ]
 
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._statics: Optional[tuple[Static, Static, Static]] = None
+
     def compose(self) -> ComposeResult:
         with TabbedContent(id="detail-tabs", initial="detail-tab-info"):
             with TabPane("Info", id="detail-tab-info"):
@@ -150,9 +193,20 @@ class DetailPanelWidget(Container):
             scroll.can_focus = False
 
     def set_content(self, request_set: Optional[RequestSet]) -> None:
-        self.query_one("#detail-info", Static).update(self._format_request_info(request_set))
-        self.query_one("#detail-headers", Static).update(self._format_request_headers(request_set))
-        self.query_one("#detail-body", Static).update(self._format_request_body(request_set))
+        details = request_set.detail_cache if request_set is not None else None
+        if details is None:
+            details = (
+                self._format_request_info(request_set),
+                self._format_request_headers(request_set),
+                self._format_request_body(request_set),
+            )
+            if request_set is not None:
+                request_set.detail_cache = details
+        info_text, headers_text, body_text = details
+        info_static, headers_static, body_static = self._get_statics()
+        info_static.update(info_text)
+        headers_static.update(headers_text)
+        body_static.update(body_text)
 
     def action_next_tab(self) -> None:
         self._switch_tab(1)
@@ -160,6 +214,15 @@ class DetailPanelWidget(Container):
     def action_prev_tab(self) -> None:
         self._switch_tab(-1)
 
+    def _get_statics(self) -> tuple[Static, Static, Static]:
+        if self._statics is None:
+            self._statics = (
+                self.query_one("#detail-info", Static),
+                self.query_one("#detail-headers", Static),
+                self.query_one("#detail-body", Static),
+            )
+        return self._statics
+
     def _switch_tab(self, offset: int) -> None:
         tab_ids = ("detail-tab-info", "detail-tab-body", "detail-tab-headers")
         tabbed = self.query_one(TabbedContent)
@@ -186,14 +249,15 @@ class DetailPanelWidget(Container):
     def _format_request_headers(self, request_set: Optional[RequestSet]) -> str:
         if request_set is None:
             return "(none)"
-        headers_text = "\n".join(f"{key}: {value}" for key, value in request_set.headers.items())
+        headers_text = "\n".join([f"{key}: {value}" for key, value in request_set.headers.items()])
         return headers_text if headers_text else "(none)"
 
     def _format_request_body(self, request_set: Optional[RequestSet]) -> str:
         if request_set is None:
             return "(empty)"
-        if request_set.body:
-            return json.dumps(request_set.body, indent=2, ensure_ascii=False)
+        body = resolve_request_body(request_set)
+        if body:
+            return json.dumps(body, indent=2, ensure_ascii=False)
         return "(empty)"
 
 
@@ -210,6 +274,8 @@ class ResponsePanelWidget(Container):
     def __init__(self, store: RequestSetStore, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self.store = store
+        self._rendered: dict[int, tuple[Response, str, str]] = {}
+        self._statics: Optional[tuple[Static, Static]] = None
 
     def compose(self) -> ComposeResult:
         with TabbedContent(id="response-tabs", initial="response-tab-main"):
@@ -229,8 +295,14 @@ class ResponsePanelWidget(Container):
             scroll.can_focus = False
 
     def set_content(self, response: Optional[Response]) -> None:
-        self.query_one("#response-main", Static).update(self._format_response_status_body(response))
-        self.query_one("#response-headers", Static).update(self._format_response_headers(response))
+        if response is None:
+            main_text = self._format_response_status_body(None)
+            headers_text = self._format_response_headers(None)
+        else:
+            _, main_text, headers_text = self._get_rendered(response)
+        main_static, headers_static = self._get_statics()
+        main_static.update(main_text)
+        headers_static.update(headers_text)
 
     def action_next_tab(self) -> None:
         self._switch_tab(1)
@@ -247,6 +319,27 @@ class ResponsePanelWidget(Container):
             return
         copy_to_clipboard(response.body)
 
+    def _get_statics(self) -> tuple[Static, Static]:
+        if self._statics is None:
+            self._statics = (
+                self.query_one("#response-main", Static),
+                self.query_one("#response-headers", Static),
+            )
+        return self._statics
+
+    def _get_rendered(self, response: Response) -> tuple[Response, str, str]:
+        rendered = self._rendered.get(id(response))
+        if rendered is None:
+            rendered = (
+                response,
+                self._format_response_status_body(response),
+                self._format_response_headers(response),
+            )
+            self._rendered[id(response)] = rendered
+            if len(self._rendered) > RESPONSE_CACHE_SIZE:
+                del self._rendered[next(iter(self._rendered))]
+        return rendered
+
     def _switch_tab(self, offset: int) -> None:
         tab_ids = ("response-tab-main", "response-tab-headers")
         tabbed = self.query_one(TabbedContent)
@@ -275,27 +368,42 @@ class ResponsePanelWidget(Container):
     def _format_response_headers(self, response: Optional[Response]) -> str:
         if response is None:
             return "(none)"
-        headers_text = "\n".join(f"{key}: {value}" for key, value in (response.headers or {}).items())
+        headers = response.headers or {}
+        headers_text = "\n".join([f"{key}: {value}" for key, value in headers.items()])
         return headers_text if headers_text else "(none)"
 
     def _format_response_body(self, response: Response) -> str:
         body_text = response.body if response.body else ""
-        if body_text:
-            content_type = ""
-            if response.headers:
-                content_type = response.headers.get("Content-Type", "")
-            should_format_json = "application/json" in content_type.lower()
-            if should_format_json or body_text.strip().startswith(("{", "[")):
+        if body_text and len(body_text) <= PRETTY_PRINT_MAX:
+            should_format_json = response.content_type.startswith("application/json")
+            if should_format_json or body_text[:64].lstrip().startswith(("{", "[")):
                 try:
-                    body_text = json.dumps(json.loads(body_text), indent=2, ensure_ascii=False)
+                    body_text = self._pretty_print_json(body_text)
                 except json.JSONDecodeError:
                     pass
         if not body_text:
             body_text = "(empty)"
-        if len(body_text) > 4000:
-            body_text = body_text[:4000] + "\n... (truncated)"
+        if len(body_text) > BODY_DISPLAY_LIMIT:
+            body_text = body_text[:BODY_DISPLAY_LIMIT] + "\n... (truncated)"
         return body_text
 
+    def _pretty_print_json(self, body_text: str) -> str:
+        non_finite: list[str] = []
+
+        def parse_float(text: str) -> float:
+            value = float(text)
+            if not math.isfinite(value):
+                non_finite.append(text)
+            return value
+
+        data = json.loads(body_text, parse_float=parse_float, parse_constant=parse_float)
+        if orjson is not None and not non_finite:
+            try:
+                return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+            except TypeError:
+                pass
+        return json.dumps(data, indent=2, ensure_ascii=False)
+
 
 class ConfirmDeleteScreen(ModalScreen[bool]):
     BINDINGS = [
@@ -346,8 +454,9 @@ class TcurlApp(App):
 
     def __init__(self) -> None:
         super().__init__()
-        self.store = RequestSetStore()
+        self.store = RequestSetStore(schedule=self.call_later)
         self.store.subscribe_selection(self._on_selection_change)
+        self.request_list: Optional[RequestListWidget] = None
         self.detail_panel: Optional[DetailPanelWidget] = None
         self.response_panel: Optional[ResponsePanelWidget] = None
 
@@ -367,20 +476,23 @@ class TcurlApp(App):
         yield Footer()
 
     def on_mount(self) -> None:
-        request_list = self.query_one(RequestListWidget)
+        self.request_list = self.query_one(RequestListWidget)
         self.detail_panel = self.query_one(DetailPanelWidget)
         self.response_panel = self.query_one(ResponsePanelWidget)
         self.store.refresh()
-        request_list.focus()
+        self.request_list.focus()
 
-    async def on_request_list_widget_run_requested(self, message: RequestListWidget.RunRequested) -> None:
+    def on_request_list_widget_run_requested(self, message: RequestListWidget.RunRequested) -> None:
         request_set = message.request_set
-        self.store.set_response(request_set, Response(note="Running..."))
+        self.store.set_response(request_set, RUNNING_RESPONSE)
         self._show_request_details(request_set)
+        self.run_worker(self._run_request(request_set), group=str(request_set.file_path), exclusive=True)
+
+    async def _run_request(self, request_set: RequestSet) -> None:
         response = await execute_request(request_set)
-        self.store.set_response(request_set, response)
-        if self._is_selected(request_set):
-            self._show_request_details(request_set)
+        current = self.store.set_response(request_set, response)
+        if current is not None and self._is_selected(current):
+            self._show_request_details(current)
 
     def _show_request_details(self, request_set: Optional[RequestSet]) -> None:
         detail_panel = self.detail_panel
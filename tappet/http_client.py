@@ -1,16 +1,18 @@
 import httpx
 
 from tappet.models import RequestSet, Response
+from tappet.storage.requests import resolve_request_body
 
 
 async def execute_request(request_set: RequestSet) -> Response:
+    body = resolve_request_body(request_set)
     try:
         async with httpx.AsyncClient(follow_redirects=True) as client:
             response = await client.request(
                 request_set.method,
                 request_set.url,
                 headers=request_set.headers,
-                json=request_set.body if request_set.body else None,
+                json=body if body else None,
             )
     except Exception as exc:
         return Response(error=str(exc))
@@ -22,6 +24,7 @@ async def execute_request(request_set: RequestSet) -> Response:
         status_code=response.status_code,
         reason=response.reason_phrase,
         headers=dict(response.headers),
+        content_type=response.headers.get("content-type", "").lower(),
         body=response.text,
         elapsed_ms=elapsed_ms,
     )
@@ -1,26 +1,32 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Optional
+import sys
+from typing import Any, Dict, Optional, Tuple
 
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(eq=False, **_DATACLASS_SLOTS)
 class RequestSet:
     name: str
     method: str
     url: str
     headers: Dict[str, str]
-    body: Optional[Dict[str, Any]]
+    body_source: Any
     description: Optional[str] = ""
     file_path: Optional[Path] = None
+    _body: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False)
+    detail_cache: Optional[Tuple[Any, ...]] = field(default=None, init=False, repr=False)
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class Response:
     status_code: Optional[int] = None
     reason: Optional[str] = None
     headers: Optional[Dict[str, str]] = None
+    content_type: str = ""
     body: str = ""
     elapsed_ms: Optional[float] = None
     error: Optional[str] = None
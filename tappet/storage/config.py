@@ -6,26 +6,38 @@ import yaml
 
 from tappet.storage.paths import CONFIG_DIR, CONFIG_PATH
 
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 DEFAULT_CONFIG = {
     "http": {"timeout": 10},
     "editor": "vim",
     "ui": {"theme": "default"},
 }
 
+_CONFIG_READY = False
+
 
 def ensure_config() -> None:
+    global _CONFIG_READY
+    if _CONFIG_READY:
+        return
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
     if not CONFIG_PATH.exists():
         CONFIG_PATH.write_text(
-            yaml.safe_dump(DEFAULT_CONFIG, sort_keys=False),
+            yaml.dump(DEFAULT_CONFIG, Dumper=YAML_DUMPER, sort_keys=False),
             encoding="utf-8",
         )
+    _CONFIG_READY = True
 
 
 def load_config() -> Dict[str, Any]:
     ensure_config()
-    with CONFIG_PATH.open("r", encoding="utf-8") as handle:
-        data = yaml.safe_load(handle)
+    try:
+        with CONFIG_PATH.open("r", encoding="utf-8") as handle:
+            data = yaml.load(handle, Loader=YAML_LOADER)
+    except FileNotFoundError:
+        return {}
     return data if isinstance(data, dict) else {}
 
 
@@ -3,3 +3,4 @@ from pathlib import Path
 CONFIG_DIR = Path.home() / ".config" / "nattoujam" / "tappet"
 REQUESTS_DIR = CONFIG_DIR / "requests"
 CONFIG_PATH = CONFIG_DIR / "config.yaml"
+CACHE_DIR = Path.home() / ".cache" / "nattoujam" / "tappet"
@@ -1,14 +1,16 @@
 from __future__ import annotations
 
+import json
+import os
 from pathlib import Path
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import yaml
 
 from tappet.models import RequestSet
-from tappet.storage.config import ensure_config
-from tappet.storage.paths import REQUESTS_DIR
+from tappet.storage.config import YAML_DUMPER, YAML_LOADER, ensure_config
+from tappet.storage.paths import CACHE_DIR, REQUESTS_DIR
 
 SAMPLE_REQUEST = {
     "name": "New Request",
@@ -22,55 +24,77 @@ SAMPLE_REQUEST = {
     },
 }
 
+_SAMPLE_YAML_BYTES = yaml.dump(SAMPLE_REQUEST, Dumper=YAML_DUMPER, sort_keys=False).encode("utf-8")
+
+_YAML_SUFFIXES = (".yaml", ".yml")
+
+_PARSE_CACHE: Dict[Path, Tuple[int, int, RequestSet]] = {}
+_DIR_READY = False
+
 
 def ensure_requests_dir() -> None:
+    global _DIR_READY
+    if _DIR_READY:
+        return
     ensure_config()
     REQUESTS_DIR.mkdir(parents=True, exist_ok=True)
-    if not any(REQUESTS_DIR.glob("*.y*ml")):
-        (REQUESTS_DIR / "example.yaml").write_text(
-            yaml.safe_dump(SAMPLE_REQUEST, sort_keys=False),
-            encoding="utf-8",
-        )
+    if not _scan_yaml_entries():
+        (REQUESTS_DIR / "example.yaml").write_bytes(_SAMPLE_YAML_BYTES)
+    _DIR_READY = True
 
 
 def load_request_sets() -> List[RequestSet]:
     ensure_requests_dir()
+    entries = _scan_yaml_entries()
+    _prune_sidecars({entry.name for entry in entries})
     request_sets: List[RequestSet] = []
+    seen = set()
 
-    for path in sorted(REQUESTS_DIR.glob("*.y*ml")):
-        data = _read_yaml(path)
-        if not isinstance(data, dict):
-            continue
-        request_sets.append(_parse_request_set(data, path))
+    for entry in entries:
+        path = Path(entry.path)
+        seen.add(path)
+        request_set = _load_request_set(path, entry.stat())
+        if request_set is not None:
+            request_sets.append(request_set)
 
+    for path in [path for path in _PARSE_CACHE if path not in seen]:
+        del _PARSE_CACHE[path]
     return request_sets
 
 
+def reload_request_set(path: Path) -> Optional[RequestSet]:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        _PARSE_CACHE.pop(path, None)
+        _remove_sidecar(path)
+        return None
+    return _load_request_set(path, stat)
+
+
 def create_request_set() -> Optional[RequestSet]:
     ensure_requests_dir()
-    file_path = _next_path()
+    file_path = _write_next_file(_SAMPLE_YAML_BYTES)
     if file_path is None:
         return None
-    file_path.write_text(
-        yaml.safe_dump(SAMPLE_REQUEST, sort_keys=False),
-        encoding="utf-8",
-    )
-    return _parse_request_set(SAMPLE_REQUEST, file_path)
+    return _cache_request_set(_parse_request_set(SAMPLE_REQUEST, file_path))
 
 
 def duplicate_request_set(request_set: RequestSet) -> Optional[RequestSet]:
     ensure_requests_dir()
-    if request_set.file_path is None or not request_set.file_path.exists():
+    if request_set.file_path is None:
+        return None
+    try:
+        content = request_set.file_path.read_bytes()
+    except FileNotFoundError:
         return None
-    source = request_set.file_path
-    file_path = _next_path()
+    file_path = _write_next_file(content)
     if file_path is None:
         return None
-    file_path.write_text(source.read_text(encoding="utf-8"), encoding="utf-8")
     data = _read_yaml(file_path)
     if not isinstance(data, dict):
         data = {}
-    return _parse_request_set(data, file_path)
+    return _cache_request_set(_parse_request_set(data, file_path))
 
 
 def delete_request_set(request_set: RequestSet) -> bool:
@@ -79,43 +103,172 @@ def delete_request_set(request_set: RequestSet) -> bool:
     if not request_set.file_path.exists():
         return False
     request_set.file_path.unlink()
+    _PARSE_CACHE.pop(request_set.file_path, None)
+    _remove_sidecar(request_set.file_path)
     return True
 
 
+def _scan_yaml_entries() -> List[os.DirEntry]:
+    with os.scandir(REQUESTS_DIR) as scanned:
+        entries = [entry for entry in scanned if entry.is_file() and entry.name.endswith(_YAML_SUFFIXES)]
+    entries.sort(key=lambda entry: entry.name)
+    return entries
+
+
+def _load_request_set(path: Path, stat: os.stat_result) -> Optional[RequestSet]:
+    cached = _PARSE_CACHE.get(path)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+    request_set = _read_sidecar(path, stat)
+    if request_set is None:
+        data = _read_yaml(path)
+        if not isinstance(data, dict):
+            _PARSE_CACHE.pop(path, None)
+            return None
+        request_set = _parse_request_set(data, path)
+        _write_sidecar(request_set, stat)
+    _PARSE_CACHE[path] = (stat.st_mtime_ns, stat.st_size, request_set)
+    return request_set
+
+
 def _read_yaml(path: Path) -> Dict[str, Any]:
-    with path.open("r", encoding="utf-8") as handle:
-        data = yaml.safe_load(handle)
+    data = yaml.load(path.read_bytes(), Loader=YAML_LOADER)
     return data or {}
 
 
+def _as_str(value: Any, default: str) -> str:
+    if isinstance(value, str):
+        return value or default
+    return str(value) if value else default
+
+
 def _parse_request_set(data: Dict[str, Any], path: Path) -> RequestSet:
-    name = str(data.get("name") or path.stem)
-    method = str(data.get("method") or "GET").upper()
-    url = str(data.get("url") or "")
-    headers = data.get("headers") if isinstance(data.get("headers"), dict) else {}
-    body = data.get("body")
-    if isinstance(body, dict):
-        pass
-    elif isinstance(body, str):
-        parsed = yaml.safe_load(body)
-        body = parsed if isinstance(parsed, dict) else {}
-    else:
-        body = {}
+    get = data.get
+    name = _as_str(get("name"), path.stem)
+    method = _as_str(get("method"), "GET")
+    if not method.isupper():
+        method = method.upper()
+    url = _as_str(get("url"), "")
+    headers = get("headers")
+    if not isinstance(headers, dict):
+        headers = {}
 
     return RequestSet(
         name=name,
         method=method,
         url=url,
         headers=headers,
-        body=body,
-        description=str(data.get("description") or ""),
+        body_source=get("body"),
+        description=_as_str(get("description"), ""),
         file_path=path,
     )
 
 
-def _next_path() -> Optional[Path]:
+def resolve_request_body(request_set: RequestSet) -> Dict[str, Any]:
+    if request_set._body is None:
+        request_set._body = _parse_body(request_set.body_source)
+    return request_set._body
+
+
+def _parse_body(source: Any) -> Dict[str, Any]:
+    if isinstance(source, dict):
+        return source
+    if isinstance(source, str):
+        try:
+            parsed = yaml.load(source, Loader=YAML_LOADER)
+        except yaml.YAMLError:
+            return {}
+        return parsed if isinstance(parsed, dict) else {}
+    return {}
+
+
+def _cache_request_set(request_set: RequestSet) -> RequestSet:
+    path = request_set.file_path
+    if path is not None:
+        stat = path.stat()
+        _PARSE_CACHE[path] = (stat.st_mtime_ns, stat.st_size, request_set)
+        _write_sidecar(request_set, stat)
+    return request_set
+
+
+def _sidecar_path(path: Path) -> Path:
+    return CACHE_DIR / f"{path.name}.json"
+
+
+def _read_sidecar(path: Path, stat: os.stat_result) -> Optional[RequestSet]:
+    try:
+        data = json.loads(_sidecar_path(path).read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict):
+        return None
+    if data.pop("_src_mtime_ns", None) != stat.st_mtime_ns or data.pop("_src_size", None) != stat.st_size:
+        return None
+    return _parse_request_set(data, path)
+
+
+def _write_sidecar(request_set: RequestSet, stat: os.stat_result) -> None:
+    if request_set.file_path is None:
+        return
+    data = {
+        "_src_mtime_ns": stat.st_mtime_ns,
+        "_src_size": stat.st_size,
+        "name": request_set.name,
+        "method": request_set.method,
+        "url": request_set.url,
+        "headers": request_set.headers,
+        "body": request_set.body_source,
+        "description": request_set.description,
+    }
+    try:
+        text = json.dumps(data, ensure_ascii=False)
+    except (TypeError, ValueError):
+        return
+    if json.loads(text) != data:
+        return
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _sidecar_path(request_set.file_path).write_text(text, encoding="utf-8")
+    except OSError:
+        pass
+
+
+def _remove_sidecar(path: Path) -> None:
+    try:
+        _sidecar_path(path).unlink()
+    except OSError:
+        pass
+
+
+def _prune_sidecars(source_names: Set[str]) -> None:
+    try:
+        with os.scandir(CACHE_DIR) as scanned:
+            stale = [
+                entry.path for entry in scanned
+                if entry.name.endswith(".json") and entry.name[:-len(".json")] not in source_names
+            ]
+    except FileNotFoundError:
+        return
+    for path in stale:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+def _write_next_file(content: bytes, retry: bool = True) -> Optional[Path]:
+    global _DIR_READY
     stamp = time.time_ns() // 1_000_000
     next_path = REQUESTS_DIR / f"{stamp}.yaml"
-    if next_path.exists():
+    try:
+        with next_path.open("xb") as handle:
+            handle.write(content)
+    except FileExistsError:
         return None
+    except FileNotFoundError:
+        if not retry:
+            return None
+        _DIR_READY = False
+        ensure_requests_dir()
+        return _write_next_file(content, retry=False)
     return next_path
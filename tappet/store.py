@@ -3,19 +3,30 @@ from __future__ import annotations
 from typing import Callable, Optional
 
 from tappet.models import RequestSet, Response
-from tappet.storage.requests import create_request_set, delete_request_set, duplicate_request_set, load_request_sets
+from tappet.storage.requests import (
+    create_request_set,
+    delete_request_set,
+    duplicate_request_set,
+    load_request_sets,
+    reload_request_set,
+)
 
 
 StoreCallback = Callable[[Optional[RequestSet]], None]
+StoreScheduler = Callable[[Callable[[], None]], object]
 
 
 class RequestSetStore:
-    def __init__(self) -> None:
+    def __init__(self, schedule: Optional[StoreScheduler] = None) -> None:
         self.items: list[RequestSet] = []
         self.selected_set: Optional[RequestSet] = None
         self._responses: dict[str, Response] = {}
         self._items_callbacks: list[StoreCallback] = []
         self._selection_callbacks: list[StoreCallback] = []
+        self._schedule = schedule
+        self._items_pending = False
+        self._selection_pending = False
+        self._flush_scheduled = False
 
     def subscribe_items(self, callback: StoreCallback) -> None:
         self._items_callbacks.append(callback)
@@ -23,26 +34,44 @@ class RequestSetStore:
     def subscribe_selection(self, callback: StoreCallback) -> None:
         self._selection_callbacks.append(callback)
 
-    def _notify_items(self, select_set: Optional[RequestSet] = None) -> None:
-        for callback in self._items_callbacks:
-            callback(select_set)
+    def _notify_items(self) -> None:
+        self._items_pending = True
+        self._request_flush()
 
-    def _notify_selection(self, select_set: Optional[RequestSet] = None) -> None:
-        for callback in self._selection_callbacks:
-            callback(select_set)
+    def _notify_selection(self) -> None:
+        self._selection_pending = True
+        self._request_flush()
+
+    def _request_flush(self) -> None:
+        if self._schedule is None:
+            self._flush()
+            return
+        if self._flush_scheduled:
+            return
+        self._flush_scheduled = True
+        self._schedule(self._flush)
+
+    def _flush(self) -> None:
+        self._flush_scheduled = False
+        items_pending, self._items_pending = self._items_pending, False
+        selection_pending, self._selection_pending = self._selection_pending, False
+        if items_pending:
+            for callback in self._items_callbacks:
+                callback(self.selected_set)
+        if selection_pending:
+            for callback in self._selection_callbacks:
+                callback(self.selected_set)
 
     def refresh(self, select_set: Optional[RequestSet] = None) -> None:
         self.items = load_request_sets()
-        self._decide_selection(select_set)
-        self._prune_responses()
-        self._notify_items(self.selected_set)
-        self._notify_selection(self.selected_set)
+        self._apply_items(select_set)
 
     def create(self) -> Optional[RequestSet]:
         created = create_request_set()
         if created is None:
             return None
-        self.refresh(select_set=created)
+        self._insert_item(created)
+        self._apply_items(created)
         return created
 
     def copy(self, request_set: RequestSet) -> Optional[RequestSet]:
@@ -51,12 +80,26 @@ class RequestSetStore:
         created = duplicate_request_set(request_set)
         if created is None:
             return None
-        self.refresh(select_set=created)
+        self._insert_item(created)
+        self._apply_items(created)
         return created
 
     def delete(self, request_set: RequestSet) -> None:
         delete_request_set(request_set)
-        self.refresh()
+        self.items = [item for item in self.items if item != request_set]
+        self._apply_items()
+
+    def reload(self, request_set: RequestSet) -> Optional[RequestSet]:
+        if request_set.file_path is None or not self._is_in_items(request_set):
+            return None
+        index = self.items.index(request_set)
+        reloaded = reload_request_set(request_set.file_path)
+        if reloaded is None:
+            del self.items[index]
+        else:
+            self.items[index] = reloaded
+        self._apply_items(reloaded)
+        return reloaded
 
     def set_selected(self, request_set: RequestSet) -> Optional[RequestSet]:
         if not self._is_in_items(request_set):
@@ -64,22 +107,39 @@ class RequestSetStore:
         if request_set == self.selected_set:
             return request_set
         self.selected_set = request_set
-        self._notify_selection(self.selected_set)
+        self._notify_selection()
         return request_set
 
     def get_selected(self) -> Optional[RequestSet]:
         return self.selected_set
 
-    def set_response(self, request_set: RequestSet, response: Response) -> None:
-        if not self._is_in_items(request_set):
-            return
-        self._responses[self._response_key(request_set)] = response
+    def set_response(self, request_set: RequestSet, response: Response) -> Optional[RequestSet]:
+        current = self._find_current(request_set)
+        if current is None:
+            return None
+        self._responses[self._response_key(current)] = response
+        return current
 
     def get_response(self, request_set: RequestSet) -> Optional[Response]:
         if not self._is_in_items(request_set):
             return None
         return self._responses.get(self._response_key(request_set))
 
+    def _apply_items(self, select_set: Optional[RequestSet] = None) -> None:
+        self._decide_selection(select_set)
+        self._prune_responses()
+        self._notify_items()
+        self._notify_selection()
+
+    def _insert_item(self, request_set: RequestSet) -> None:
+        index = len(self.items)
+        if request_set.file_path is not None:
+            for position, item in enumerate(self.items):
+                if item.file_path is not None and item.file_path > request_set.file_path:
+                    index = position
+                    break
+        self.items.insert(index, request_set)
+
     def _decide_selection(self, select_set: Optional[RequestSet]) -> None:
         if select_set is not None:
             if self._is_in_items(select_set):
@@ -96,6 +156,13 @@ class RequestSetStore:
                 return True
         return False
 
+    def _find_current(self, request_set: RequestSet) -> Optional[RequestSet]:
+        key = self._response_key(request_set)
+        for item in self.items:
+            if self._response_key(item) == key:
+                return item
+        return None
+
     def _prune_responses(self) -> None:
         if not self._responses:
             return
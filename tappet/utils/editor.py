@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import shlex
 import subprocess
 from pathlib import Path
@@ -9,9 +10,14 @@ from tappet.storage.config import get_editor_command
 
 def open_in_editor(path: Path) -> bool:
     editor = get_editor_command()
-    command = shlex.split(editor) + [str(path)]
+    command = list(_split_editor(editor)) + [str(path)]
     try:
         subprocess.run(command, check=False)
     except FileNotFoundError:
         return False
     return True
+
+
+@functools.lru_cache(maxsize=4)
+def _split_editor(editor: str) -> tuple[str, ...]:
+    return tuple(shlex.split(editor))